@@ -1,11 +1,22 @@
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import orjson
 from datetime import datetime, timezone
+import functools
+import hashlib
+import math
+import re
 import threading
 import time
-from queue import Queue, Empty
+from collections import deque
+from queue import Queue, Empty, Full
+from concurrent.futures import ThreadPoolExecutor
 
 
 # --- CONFIGURATION ---
@@ -16,8 +27,9 @@ COOKIES = {
     'auth_token': 'AUTH_TOKEN_GOES_HERE'
 }
 REFRESH_INTERVAL = 10  # seconds
+PAGE_FETCH_WORKERS = 8
 
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 
 MAX_LOGS = 200
 
@@ -25,76 +37,267 @@ manual_adjustment = 0.0
 manual_lock = threading.Lock()
 refresh_paused = False
 refresh_lock = threading.Lock()
-refresh_now = False
-refresh_now_lock = threading.Lock()
-log_entries = []
+refresh_wakeup = threading.Event()
+next_refresh_deadline = None
+log_entries = deque(maxlen=MAX_LOGS)
 log_lock = threading.Lock()
+log_timestamp_cache = (None, None)
 status = {
     "next_refresh_in": REFRESH_INTERVAL,
     "last_total": None,
-    "last_refresh": None
+    "last_refresh": None,
+    # Mirrors of refresh_paused, manual_adjustment and filters so a snapshot needs one lock
+    "refresh_paused": False,
+    "manual_adjustment": 0.0,
+    "filters": []
 }
 status_lock = threading.Lock()
-event_subscribers = set()
+status_cache = {'bytes': None, 'next_refresh_in': None}
+# Copy-on-write tuple: publishers read it without locking, writers replace it under the lock
+event_subscribers = ()
 event_subscribers_lock = threading.Lock()
 KEEPALIVE_SECONDS = 15
+SUBSCRIBER_QUEUE_SIZE = 256
+# Each open /stream holds a waitress thread for its lifetime, so cap streams
+# below the thread count to leave threads free for the other endpoints
+SERVER_THREADS = 64
+MAX_STREAM_CLIENTS = SERVER_THREADS - 8
 filters = []
 filters_lock = threading.Lock()
+# Validators and value from the last full summary page fetch, reused on 304
+summary_cache = {'etag': None, 'last_modified': None, 'value': None}
+# Last auction_items.json written by this process, served from memory
+json_cache = {'bytes': None, 'etag': None}
 
+# Selectors compiled to XPath once at import
+_SEL_NEXT = CSSSelector('ul.pagination li.next a.page-link, ul.pagination li.next a[rel="next"]')
+_SEL_LAST_PAGE = CSSSelector('ul.pagination li:nth-last-child(2) a')
+_SEL_RAISED = CSSSelector('div.raised.amt')
 
-def get_status_snapshot():
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _meta_field(label):
+    lowered = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return f"normalize-space(substring-after((.//div[{_META_CLASS}][starts-with({lowered}, '{label}:')])[last()], ':'))"
+
+
+_META_CLASS = ' and '.join(_has_class(c) for c in ('card-text', 'small', 'text-truncate', 'text-muted'))
+# First .card inside each a.item
+_CARDS_XPATH = etree.XPath(f"//a[{_has_class('item')}]/descendant::*[{_has_class('card')}][1]")
+# One string-valued XPath per card field, in order:
+# picture_url, title, price, remaining, value, bids
+_CARD_FIELD_XPATHS = tuple(etree.XPath(expr) for expr in (
+    f"string((.//*[{_has_class('img-section')}]//img)[1]/@src)",
+    f"normalize-space((.//h5[{_has_class('text-truncate-2')} and {_has_class('narrow')}])[1])",
+    f"normalize-space((.//h6[{_has_class('text-truncate')}])[1])",
+    _meta_field('remaining'),
+    _meta_field('value'),
+    _meta_field('bids'),
+))
+
+_MONEY_RE = re.compile(r'([-+]?)\$?(\d[\d,]*(?:\.\d+)?)')
+_COUNT_RE = re.compile(r'\d[\d,]*')
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+
+def get_status_snapshot_bytes():
+    """Return the serialized status, rebuilding it only after a change or countdown tick."""
     with status_lock:
-        snapshot = dict(status)
-    with refresh_lock:
-        snapshot['refresh_paused'] = refresh_paused
-    with manual_lock:
-        snapshot['manual_adjustment'] = manual_adjustment
-    with filters_lock:
-        snapshot['filters'] = list(filters)
-    snapshot['refresh_interval'] = REFRESH_INTERVAL
-    return snapshot
+        next_refresh_in = status['next_refresh_in']
+        if next_refresh_deadline is not None:
+            # Countdown is derived on read instead of being written every second
+            next_refresh_in = max(0, math.ceil(next_refresh_deadline - time.monotonic()))
+        if status_cache['bytes'] is None or status_cache['next_refresh_in'] != next_refresh_in:
+            snapshot = dict(status)
+            snapshot['next_refresh_in'] = next_refresh_in
+            snapshot['refresh_interval'] = REFRESH_INTERVAL
+            status_cache['bytes'] = orjson.dumps(snapshot)
+            status_cache['next_refresh_in'] = next_refresh_in
+        return status_cache['bytes']
 
 
 def publish_event(event_type, data):
-    payload = {'type': event_type, 'data': data}
-    with event_subscribers_lock:
-        subscribers = list(event_subscribers)
+    subscribers = event_subscribers
+    if not subscribers:
+        return
+    # Build the SSE frame once and hand the same bytes to every subscriber
+    if not isinstance(data, bytes):
+        data = orjson.dumps(data)
+    payload = f"event: {event_type}\ndata: ".encode() + data + b"\n\n"
     for q in subscribers:
         try:
-            q.put(payload, timeout=0.1)
-        except Exception:
-            continue
+            q.put_nowait(payload)
+        except Full:
+            # Slow subscriber: drop its oldest event to make room
+            try:
+                q.get_nowait()
+                q.put_nowait(payload)
+            except (Empty, Full):
+                continue
 
 
 def update_status(**kwargs):
+    global next_refresh_deadline
     if kwargs:
         with status_lock:
             status.update(kwargs)
-    snapshot = get_status_snapshot()
+            status_cache['bytes'] = None
+            if 'next_refresh_in' in kwargs:
+                next_refresh_deadline = None
+    snapshot = get_status_snapshot_bytes()
     publish_event('status', snapshot)
     return snapshot
 
 
 def subscribe_events():
-    q = Queue()
+    global event_subscribers
+    q = Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
     with event_subscribers_lock:
-        event_subscribers.add(q)
+        event_subscribers = event_subscribers + (q,)
     return q
 
 
 def unsubscribe_events(q):
+    global event_subscribers
     with event_subscribers_lock:
-        event_subscribers.discard(q)
+        event_subscribers = tuple(s for s in event_subscribers if s is not q)
 
 def add_log(message):
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S %Z')
+    global log_timestamp_cache
+    second = int(time.time())
+    cached_second, timestamp = log_timestamp_cache
+    if second != cached_second:
+        # Only reformat once per second; bursts of log lines reuse the string
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(second))
+        log_timestamp_cache = (second, timestamp)
     entry = {"timestamp": timestamp, "message": message}
     with log_lock:
         log_entries.append(entry)
-        if len(log_entries) > MAX_LOGS:
-            log_entries.pop(0)
     publish_event('log', entry)
 
+def parse_money_cents(text):
+    """Parse the first dollar amount in text into integer cents, or None."""
+    match = _MONEY_RE.search(text) if text else None
+    if not match:
+        return None
+    cents = int(round(float(match.group(2).replace(',', '')) * 100))
+    return -cents if match.group(1) == '-' else cents
+
+
+def parse_count(text):
+    """Parse the first integer in text, or None."""
+    match = _COUNT_RE.search(text) if text else None
+    return int(match.group(0).replace(',', '')) if match else None
+
+
+def parse_item_cards(root, progress_cb=None):
+    """
+    Extract item dicts from a parsed auction page.
+    Args:
+        root (lxml.html.HtmlElement): The parsed page.
+        progress_cb (callable): Called with a message for each item found.
+    Returns:
+        list: List of item dicts.
+    """
+    items = []
+    for card in _CARDS_XPATH(root):
+        # Missing fields come back as empty strings
+        picture_url, title, price, remaining, value, bids = (
+            xpath(card) or None for xpath in _CARD_FIELD_XPATHS
+        )
+        # Meta labels were matched case-insensitively; values are reported lowercased as before
+        remaining = remaining.lower() if remaining else None
+        value = value.lower() if value else None
+        bids = bids.lower() if bids else None
+        items.append({
+            'title': title,
+            'picture_url': picture_url,
+            'price': price,
+            'remaining': remaining,
+            'value': value,
+            'bids': bids,
+            'price_cents': parse_money_cents(price),
+            'value_cents': parse_money_cents(value),
+            'bids_int': parse_count(bids)
+        })
+        if progress_cb:
+            progress_cb(f"🔍 Found: {title[:60] if title else 'Untitled'}")
+    return items
+
+
+@functools.lru_cache(maxsize=None)
+def get_html_parser(encoding):
+    try:
+        return lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # libxml2 doesn't know this charset name; let it sniff the document instead
+        return None
+
+
+def parse_html(response):
+    """
+    Parse response bytes with lxml.
+    Decodes with the Content-Type charset if given, else the document's own
+    <meta> charset, else UTF-8 (lxml would otherwise assume Latin-1).
+    """
+    content_type = response.headers.get('Content-Type', '').lower()
+    if 'charset' in content_type:
+        parser = get_html_parser(response.encoding)
+    elif _META_CHARSET_RE.search(response.content, 0, 2048):
+        parser = None
+    else:
+        parser = get_html_parser('utf-8')
+    return lxml.html.fromstring(response.content, parser=parser)
+
+
+def fetch_page(page_url, session=None):
+    """Fetch a page and return its parsed root, or None on error."""
+    try:
+        response = session.get(page_url)
+        response.raise_for_status()
+        # lxml raises ParserError on an empty body, so parse inside the try too
+        return parse_html(response)
+    except Exception as e:
+        add_log(f"❌ Error fetching {page_url}: {e}")
+        return None
+
+
+def get_last_page(root):
+    """Return the last page number from the pagination links, or None."""
+    links = _SEL_LAST_PAGE(root)
+    if not links:
+        return None
+    try:
+        return int(links[0].text_content().strip())
+    except ValueError:
+        return None
+
+
+def build_page_url(url, page):
+    """Return url with its 'page' query parameter set to page."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'page']
+    query.append(('page', str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def same_url(a, b):
+    """Compare two URLs ignoring query parameter order."""
+    a, b = urlsplit(a), urlsplit(b)
+    return (a._replace(query=''), sorted(parse_qsl(a.query, keep_blank_values=True))) == \
+        (b._replace(query=''), sorted(parse_qsl(b.query, keep_blank_values=True)))
+
+
+def get_next_url(root, base_url):
+    """Return the absolute URL of the page's next link, or None."""
+    next_links = _SEL_NEXT(root)
+    href = next_links[0].get('href') if next_links else None
+    return urljoin(base_url, href) if href else None
+
+
 def fetch_auction_items(url, session=None, progress_cb=None):
     """
     Scrape all auction items from paginated auction site.
@@ -105,86 +308,64 @@ def fetch_auction_items(url, session=None, progress_cb=None):
         list: List of item dicts.
     """
     items = []
-    next_url = url
-    seen_pages = set()
-    while next_url and next_url not in seen_pages:
-        seen_pages.add(next_url)
-        try:
-            response = session.get(next_url)
-            response.raise_for_status()
-        except Exception as e:
-            add_log(f"❌ Error fetching {next_url}: {e}")
-            break
-        soup = BeautifulSoup(response.text, 'html.parser')
-        # Each item is an <a> with class 'item'
-        for a in soup.select('a.item'):
-            card = a.select_one('.card')
-            if not card:
-                continue
-            # Image URL
-            img = card.select_one('.img-section img')
-            picture_url = img['src'] if img and 'src' in img.attrs else None
-            # Title
-            title = None
-            h5 = card.select_one('h5.text-truncate-2.narrow')
-            if h5:
-                title = h5.get_text(strip=True)
-            # Price (Buy Now or Bid)
-            price = None
-            h6 = card.select_one('h6.text-truncate')
-            if h6:
-                price = h6.get_text(strip=True)
-            # Remaining, Value, Bids
-            remaining = None
-            value = None
-            bids = None
-            for div in card.select('div.card-text.small.text-truncate.text-muted'):
-                text = div.get_text(strip=True).lower()
-                if text.startswith('remaining:'):
-                    remaining = text.replace('remaining:', '').strip()
-                elif text.startswith('value:'):
-                    value = text.replace('value:', '').strip()
-                elif text.startswith('bids:'):
-                    bids = text.replace('bids:', '').strip()
-            items.append({
-                'title': title,
-                'picture_url': picture_url,
-                'price': price,
-                'remaining': remaining,
-                'value': value,
-                'bids': bids
-            })
-            if progress_cb:
-                progress_cb(f"🔍 Found: {title[:60] if title else 'Untitled'}")
-        # Find next page link
-        next_link = soup.select_one('ul.pagination li.next a.page-link, ul.pagination li.next a[rel="next"]')
-        if next_link and next_link.get('href'):
-            next_url = urljoin(next_url, next_link['href'])
+    root = fetch_page(url, session=session)
+    if root is not None:
+        items.extend(parse_item_cards(root, progress_cb))
+        last_page = get_last_page(root)
+        next_url = get_next_url(root, url)
+        # Only go parallel if the site's own next link matches our ?page=N scheme
+        if last_page and next_url and same_url(next_url, build_page_url(url, 2)):
+            page_urls = [build_page_url(url, page) for page in range(2, last_page + 1)]
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                for page_root in executor.map(lambda u: fetch_page(u, session=session), page_urls):
+                    if page_root is not None:
+                        items.extend(parse_item_cards(page_root, progress_cb))
         else:
-            next_url = None
+            # Page count or URL scheme unknown; follow next links one at a time
+            seen_pages = {url}
+            while next_url and next_url not in seen_pages:
+                seen_pages.add(next_url)
+                root = fetch_page(next_url, session=session)
+                if root is None:
+                    break
+                items.extend(parse_item_cards(root, progress_cb))
+                next_url = get_next_url(root, next_url)
     if progress_cb:
         progress_cb(f"🔍 Scrape collected {len(items)} items")
     return items
 
 
+@functools.lru_cache(maxsize=32)
+def compile_filters(terms):
+    """
+    Compile filter terms into one case-insensitive pattern with a named group per
+    term, plus a pattern per term for rechecking filter order. None if empty.
+    """
+    if not terms:
+        return None
+    combined = re.compile('|'.join(f'(?P<f{i}>{re.escape(term)})' for i, term in enumerate(terms)), re.IGNORECASE)
+    return combined, tuple(re.compile(re.escape(term), re.IGNORECASE) for term in terms)
+
+
 def apply_filters_to_items(items):
     """Filter items using active keyword list, returns kept items and filtered details."""
     with filters_lock:
-        active_filters = [(f, f.lower()) for f in filters if f]
-    if not active_filters:
+        active_filters = tuple(f for f in filters if f)
+    compiled = compile_filters(active_filters)
+    if compiled is None:
         return items, []
+    pattern, term_patterns = compiled
     filtered_items = []
     filtered_out = []
     for item in items:
         title = item.get('title') or ''
-        title_lower = title.lower()
-        matched = None
-        for original, term in active_filters:
-            if term in title_lower:
-                matched = original
-                break
-        if matched:
-            filtered_out.append((item, matched))
+        match = pattern.search(title)
+        if match:
+            # Group names are f<index> into active_filters. The leftmost match may be a
+            # later filter, so report the first filter in configured order that matches.
+            index = int(match.lastgroup[1:])
+            index = next((i for i in range(index) if term_patterns[i].search(title)), index)
+            filtered_out.append((item, active_filters[index]))
             continue
         filtered_items.append(item)
     return filtered_items, filtered_out
@@ -200,13 +381,22 @@ def get_total_raised(summary_url, session=None):
     Returns:
         str or None: The total raised value as a string, or None if not found.
     """
+    headers = {}
+    if summary_cache['etag']:
+        headers['If-None-Match'] = summary_cache['etag']
+    if summary_cache['last_modified']:
+        headers['If-Modified-Since'] = summary_cache['last_modified']
     try:
-        response = session.get(summary_url)
+        response = session.get(summary_url, headers=headers)
+        if response.status_code == 304:
+            return summary_cache['value']
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        amt_div = soup.select_one('div.raised.amt')
-        if amt_div:
-            return amt_div.get_text(strip=True)
+        amt_divs = _SEL_RAISED(parse_html(response))
+        value = amt_divs[0].text_content().strip() if amt_divs else None
+        summary_cache['etag'] = response.headers.get('ETag')
+        summary_cache['last_modified'] = response.headers.get('Last-Modified')
+        summary_cache['value'] = value
+        return value
     except Exception as e:
         add_log(f"❌ Error fetching total raised: {e}")
     return None
@@ -215,47 +405,50 @@ def get_total_raised(summary_url, session=None):
 from flask import request
 
 def main():
-    global refresh_paused, refresh_now
+    global next_refresh_deadline, json_cache
+    last_output_hash = None
+    last_changed_at = None
     add_log("⏳ Starting 32datasources auction data retrieval service...")
     session = requests.Session()
     session.cookies.update(COOKIES)
+    # Pool keep-alive connections so paginated fetches reuse one TLS session
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    session.headers['Connection'] = 'keep-alive'
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
     try:
         while True:
             with refresh_lock:
                 paused = refresh_paused
             if paused:
-                with status_lock:
-                    status["next_refresh_in"] = None
-                time.sleep(1)
-                continue
-
-            with refresh_now_lock:
-                do_refresh_now = refresh_now
-                if do_refresh_now:
-                    refresh_now = False
-
-            if not do_refresh_now:
-                for i in range(REFRESH_INTERVAL, 0, -1):
-                    with refresh_lock:
-                        if refresh_paused:
-                            paused = True
-                    if paused:
+                # No countdown while paused, including after a manual refresh
+                update_status(next_refresh_in=None)
+                # Sleep until resumed or a manual refresh is requested
+                refresh_wakeup.wait()
+                refresh_wakeup.clear()
+                with refresh_lock:
+                    paused = refresh_paused
+                if not paused:
+                    continue
+            else:
+                # Set the deadline under refresh_lock so a concurrent pause either
+                # sees it and clears it, or is seen here and no deadline is set
+                with refresh_lock:
+                    if not refresh_paused:
                         with status_lock:
-                            status["next_refresh_in"] = None
-                        break
-                    with refresh_now_lock:
-                        if refresh_now:
-                            do_refresh_now = True
-                            refresh_now = False
-                            break
-                    with status_lock:
-                        status["next_refresh_in"] = i
-                    time.sleep(1)
+                            next_refresh_deadline = time.monotonic() + REFRESH_INTERVAL
+                refresh_wakeup.wait(REFRESH_INTERVAL)
+                refresh_wakeup.clear()
+                with refresh_lock:
+                    paused = refresh_paused
                 if paused:
+                    with status_lock:
+                        next_refresh_deadline = None
                     continue
 
             with status_lock:
                 status["next_refresh_in"] = 0
+                next_refresh_deadline = None
             add_log("🚀 Beginning scrape cycle")
             start_time = datetime.now(timezone.utc)
             items = fetch_auction_items(URL, session=session, progress_cb=add_log)
@@ -276,23 +469,40 @@ def main():
             except Exception:
                 total_raised_display = f"{total_raised} (+{adj:+.2f})"
             output = {
-                'refreshed_at': datetime.now(timezone.utc).isoformat(),
+                'refreshed_at': None,
+                'changed_at': None,
                 'url': URL,
                 'total_items': len(kept_items),
                 'total_raised': total_raised_display,
                 'items': kept_items
             }
-            with open('auction_items.json', 'w', encoding='utf-8') as f:
-                json.dump(output, f, ensure_ascii=False, indent=2)
+            # Hash without the timestamps to tell when the data itself last changed
+            content_hash = hashlib.blake2b(orjson.dumps(output), digest_size=16).digest()
+            refreshed_at = datetime.now(timezone.utc).isoformat()
+            if content_hash != last_output_hash:
+                last_output_hash = content_hash
+                last_changed_at = refreshed_at
+            # refreshed_at is rewritten every cycle so readers can tell the scraper is alive
+            output['refreshed_at'] = refreshed_at
+            output['changed_at'] = last_changed_at
+            output_bytes = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+            tmp_path = 'auction_items.json.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(output_bytes)
+            os.replace(tmp_path, 'auction_items.json')
+            # Rebind rather than mutate so /auction_items.json never sees a mixed pair
+            json_cache = {'bytes': output_bytes, 'etag': hashlib.blake2b(output_bytes, digest_size=16).hexdigest()}
             end_time = datetime.now(timezone.utc)
             duration = (end_time - start_time).total_seconds()
             add_log(f"🎉 Inventory completed at {end_time.strftime('%Y-%m-%d %H:%M:%S %Z')} (Duration: {duration:.2f} seconds)")
             add_log(f"💾 Saved {len(kept_items)} items to auction_items.json")
             add_log(f"💰 Total Raised: {total_raised_display}")
+            with refresh_lock:
+                paused = refresh_paused
             update_status(
                 last_total=total_raised_display,
                 last_refresh=end_time.isoformat(),
-                next_refresh_in=REFRESH_INTERVAL
+                next_refresh_in=None if paused else REFRESH_INTERVAL
             )
     except KeyboardInterrupt:
         add_log("🛑 Stopped by user.")
@@ -301,6 +511,7 @@ def main():
 from threading import Thread
 from flask import Flask, send_file, jsonify, Response, stream_with_context
 from flask_cors import CORS
+from waitress import serve
 import os
 
 
@@ -318,7 +529,7 @@ def set_adjustment():
         with manual_lock:
             manual_adjustment = amt
         add_log(f"Manual adjustment set to {manual_adjustment:+.2f}")
-        update_status()
+        update_status(manual_adjustment=amt)
         return jsonify({'status': 'ok', 'manual_adjustment': manual_adjustment}), 200
     except Exception as e:
         return jsonify({'error': str(e), 'data': data}), 400
@@ -346,9 +557,11 @@ def set_filters():
             filters.clear()
             filters.extend(parsed_filters)
             active_filters = list(filters)
+        # Compile now so the next scrape cycle finds the pattern already cached
+        compile_filters(tuple(active_filters))
         display_value = ', '.join(active_filters) if active_filters else 'none'
         add_log(f"Filters updated: {display_value}")
-        update_status()
+        update_status(filters=active_filters)
         return jsonify({'status': 'ok', 'filters': active_filters}), 200
     except Exception as e:
         return jsonify({'error': str(e), 'data': data}), 400
@@ -356,7 +569,7 @@ def set_filters():
 # REST API to pause/resume/refresh
 @app.route('/refresh', methods=['POST'])
 def set_refresh():
-    global refresh_paused, refresh_now
+    global refresh_paused
     data = None
     try:
         data = request.get_json(force=True)
@@ -366,17 +579,20 @@ def set_refresh():
         if state == 'pause':
             with refresh_lock:
                 refresh_paused = True
-            update_status(next_refresh_in=None)
+            update_status(next_refresh_in=None, refresh_paused=True)
             message = "⏸️ Refresh paused"
         elif state == 'resume':
             with refresh_lock:
+                was_paused = refresh_paused
                 refresh_paused = False
-            update_status(next_refresh_in=REFRESH_INTERVAL)
+            # Only wake the loop on a real resume; a repeated resume must not trigger a scrape
+            if was_paused:
+                update_status(next_refresh_in=REFRESH_INTERVAL, refresh_paused=False)
+                refresh_wakeup.set()
             message = "▶️ Refresh resumed"
         elif state == 'now':
-            with refresh_now_lock:
-                refresh_now = True
             update_status(next_refresh_in=0)
+            refresh_wakeup.set()
             triggered = True
             message = "🔁 Manual refresh requested"
         if message:
@@ -394,26 +610,27 @@ def get_logs():
 
 @app.route('/status')
 def get_status():
-    return jsonify(get_status_snapshot())
+    return Response(get_status_snapshot_bytes(), mimetype='application/json')
 
 
 @app.route('/stream')
 def stream_events():
+    if len(event_subscribers) >= MAX_STREAM_CLIENTS:
+        return jsonify({'error': 'too many open streams'}), 503
+
     def event_stream():
         q = subscribe_events()
         try:
-            yield f"event: status\ndata: {json.dumps(get_status_snapshot())}\n\n"
+            yield b"event: status\ndata: " + get_status_snapshot_bytes() + b"\n\n"
             with log_lock:
                 logs_copy = list(log_entries)
             if logs_copy:
-                yield f"event: logs\ndata: {json.dumps(logs_copy)}\n\n"
+                yield b"event: logs\ndata: " + orjson.dumps(logs_copy) + b"\n\n"
             while True:
                 try:
-                    event = q.get(timeout=KEEPALIVE_SECONDS)
+                    yield q.get(timeout=KEEPALIVE_SECONDS)
                 except Empty:
-                    yield "event: ping\ndata: {}\n\n"
-                    continue
-                yield f"event: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+                    yield b"event: ping\ndata: {}\n\n"
         finally:
             unsubscribe_events(q)
 
@@ -732,8 +949,14 @@ def index():
 
 @app.route('/auction_items.json')
 def serve_json():
+    cache = json_cache
+    if cache['bytes'] is not None:
+        response = Response(cache['bytes'], mimetype='application/json')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.set_etag(cache['etag'])
+        return response.make_conditional(request)
     if os.path.exists('auction_items.json'):
-        return send_file('auction_items.json', mimetype='application/json')
+        return send_file('auction_items.json', mimetype='application/json', conditional=True)
     else:
         return jsonify({'error': 'auction_items.json not found'}), 404
 
@@ -744,5 +967,5 @@ if __name__ == '__main__':
     # Start scraper in a background thread
     scraper_thread = Thread(target=run_scraper, daemon=True)
     scraper_thread.start()
-    # Start Flask server
-    app.run(host='0.0.0.0', port=8081)
+    # Start Flask app under waitress; each /stream client holds a worker thread
+    serve(app, host='0.0.0.0', port=8081, threads=SERVER_THREADS, connection_limit=256, channel_timeout=300)